@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled replacement for `json_to_xlsx._encode_row`.
+
+Build it in place with `cythonize -i _sheet_c.pyx`; `json_to_xlsx` falls back
+to its pure-Python encoder whenever this module cannot be imported. The output
+must stay byte-for-byte identical to the Python implementation.
+"""
+from libc.math cimport isfinite
+
+# Keep in sync with json_to_xlsx._MAX_NUMERIC_DIGITS.
+cdef Py_ssize_t MAX_NUMERIC_DIGITS = 11
+cdef object MAX_NUMERIC_INT = 10 ** MAX_NUMERIC_DIGITS
+
+
+cdef inline bint _is_plain_integer(str text):
+    cdef Py_ssize_t length = len(text)
+    cdef Py_UCS4 char
+    if length == 0 or length > MAX_NUMERIC_DIGITS:
+        return False
+    if length > 1 and text[0] == u"0":
+        return False
+    for char in text:
+        if char < u"0" or char > u"9":
+            return False
+    return True
+
+
+def encode_row(Py_ssize_t row_index, row, list column_names, dict shared_strings):
+    cdef bytes row_ref = b"%d" % row_index
+    cdef list parts = [b'<row r="', row_ref, b'">']
+    cdef bytes column_name
+    cdef str text
+    cdef object index
+    for column_name, value in zip(column_names, row):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            text = <str>value
+            if not text:
+                continue
+            if _is_plain_integer(text):
+                parts += (b'<c r="', column_name, row_ref, b'"><v>', text.encode("ascii"), b"</v></c>")
+                continue
+        elif isinstance(value, bool):
+            parts += (b'<c r="', column_name, row_ref, b'" t="b"><v>', b"1" if value else b"0", b"</v></c>")
+            continue
+        elif isinstance(value, int):
+            if -MAX_NUMERIC_INT < value < MAX_NUMERIC_INT:
+                parts += (b'<c r="', column_name, row_ref, b'"><v>', b"%d" % value, b"</v></c>")
+                continue
+            text = str(value)
+        elif isinstance(value, float) and isfinite(value):
+            parts += (b'<c r="', column_name, row_ref, b'"><v>', repr(value).encode("ascii"), b"</v></c>")
+            continue
+        else:
+            text = str(value)
+        index = shared_strings.get(text)
+        if index is None:
+            index = shared_strings[text] = len(shared_strings)
+        parts += (b'<c r="', column_name, row_ref, b'" t="s"><v>', b"%d" % index, b"</v></c>")
+    parts.append(b"</row>\n")
+    return b"".join(parts)
@@ -1,6 +1,12 @@
-import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+    import json
+
 
 def main():
     root = Path(__file__).resolve().parent
@@ -8,18 +14,23 @@ def main():
     if not live_data_dir.exists():
         raise SystemExit("live_data 目录不存在")
 
-    files = sorted(
-        [
-            path.name
-            for path in live_data_dir.iterdir()
-            if path.is_file() and path.suffix.lower() == ".xlsx"
-        ],
-        reverse=True,
-    )
+    # DirEntry caches the file type from readdir, so no per-file stat is needed.
+    with os.scandir(live_data_dir) as entries:
+        files = sorted(
+            (
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(".xlsx") and entry.is_file()
+            ),
+            reverse=True,
+        )
 
     output = {"files": files}
     output_path = live_data_dir / "index.json"
-    output_path.write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"写入 {output_path}，共 {len(files)} 个文件")
 
 
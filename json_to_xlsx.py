@@ -3,17 +3,52 @@
 Convert the `data.data_string.data.series` payload inside a JSON file into
 an XLSX workbook that contains both English field names and their Chinese
 labels in the first two rows. The XLSX file is generated directly using the
-OOXML specification so no third-party dependency is required.
+OOXML specification so no third-party dependency is required; `orjson` is
+used for parsing, `ijson` for streaming `data.series`, `deflate`
+(libdeflate) for compressing the worksheet with the default `--jobs 1` and
+the optional `_sheet_c` Cython extension for encoding rows when they are
+available.
 """
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+import io
+from itertools import chain
 import json
+import math
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Sequence
-from xml.sax.saxutils import escape
-from zipfile import ZIP_DEFLATED, ZipFile
+import re
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, Sequence
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+import zlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import deflate
+except ImportError:  # pragma: no cover - optional accelerator
+    deflate = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional accelerator
+    ijson = None
+
+try:
+    import _sheet_c  # built from _sheet_c.pyx with `cythonize -i`
+except ImportError:  # pragma: no cover - optional accelerator
+    _sheet_c = None
+
+DEFAULT_COMPRESSLEVEL = 1
+_PARALLEL_CHUNK_SIZE = 1 << 20
 
 FIELD_LABELS = {
     "timeMinute": "时刻",
@@ -42,17 +77,85 @@ FIELD_LABELS = {
 }
 
 
-def _load_data_string_series(json_path: Path) -> list[dict]:
-    with json_path.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+class _StreamedSeries:
+    """Re-iterable view of ``data.series`` that decodes one entry at a time.
+
+    Every pass re-parses ``data_string`` with ijson, so only the raw text and
+    the current entry are held in memory instead of the whole decoded list.
+    """
+
+    def __init__(self, data_string: str) -> None:
+        self._data = data_string.encode("utf-8")
+
+    def __iter__(self) -> Iterator[dict]:
+        return ijson.items(self._data, "data.series.item", use_float=True)
+
+    def has_series(self) -> bool:
+        """Whether ``data.series`` is a list, parsing no further than its start.
+
+        Anything else (missing, not a list, ``data`` not an object) is left to
+        the eager loader so that the same errors are raised either way.
+        """
+        for prefix, event, _ in ijson.parse(self._data, use_float=True):
+            if prefix == "data.series":
+                return event == "start_array"
+        return False
+
+
+# 19 or more consecutive digits may be an integer literal wider than 64 bits.
+_LONG_DIGITS = re.compile(r"[0-9][0-9]{18}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9][0-9]{18}")
+
+
+def _loads(data: bytes | str, exact_ints: bool = True) -> object:
+    """Parse JSON with orjson when possible, otherwise with the stdlib.
+
+    orjson rounds integers wider than 64 bits to floats and rejects ones
+    beyond float range (as well as NaN/Infinity), all of which the stdlib
+    parser keeps exactly; such input is handed to ``json.loads`` instead.
+    Pass ``exact_ints=False`` to skip the digit scan when no integer in the
+    document is used.
+    """
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(data, bytes) else _LONG_DIGITS
+        if not exact_ints or not pattern.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # let the stdlib accept it or report the error
+    return json.loads(data)
+
+
+def _load_data_string_series(json_path: Path) -> tuple[Iterable[dict], list[str]]:
+    """Return ``data.series`` together with its ordered columns.
+
+    With ijson the series is streamed and the column pass doubles as the
+    check that the whole document parses; whatever ijson rejects is loaded
+    with the full parser instead, before any workbook output is written.
+    """
+    # Only data_string is read from the envelope, so its integers don't matter.
+    payload = _loads(json_path.read_bytes(), exact_ints=False)
 
     try:
         data_string = payload["data"]["data_string"]
     except KeyError as exc:  # pragma: no cover - defensive guard
         raise KeyError("Missing data.data_string in the provided JSON file") from exc
 
+    if not isinstance(data_string, str):  # pragma: no cover - defensive guard
+        raise ValueError("data_string is not valid JSON")
+
+    if ijson is not None:
+        streamed = _StreamedSeries(data_string)
+        try:
+            if streamed.has_series():
+                return streamed, _ordered_fields(streamed)
+        except ijson.JSONError:
+            # Malformed input, or input ijson cannot represent (e.g. integers
+            # wider than 64 bits); the full parser below accepts or reports it.
+            pass
+
     try:
-        data_payload = json.loads(data_string)
+        data_payload = _loads(data_string)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise ValueError("data_string is not valid JSON") from exc
 
@@ -64,22 +167,17 @@ def _load_data_string_series(json_path: Path) -> list[dict]:
     if not isinstance(series, list):  # pragma: no cover - defensive guard
         raise TypeError("data.series must be a list")
 
-    return series
+    return series, _ordered_fields(series)
 
 
 def _ordered_fields(series: Iterable[dict]) -> list[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for entry in series:
-        for key in entry:
-            if key not in seen:
-                ordered.append(key)
-                seen.add(key)
+    # dict keeps first-seen order and gives O(1) removal of the pinned fields.
+    ordered = dict.fromkeys(chain.from_iterable(series))
     result: list[str] = []
 
     def _pop(field: str) -> str | None:
         if field in ordered:
-            ordered.remove(field)
+            del ordered[field]
             return field
         return None
 
@@ -90,6 +188,7 @@ def _ordered_fields(series: Iterable[dict]) -> list[str]:
     _pop("groupPlay")  # drop unwanted column entirely
     watch_ucnt = _pop("watchUcnt")
     pcu_total = _pop("pcuTotal")
+    _pop("keyEvent")
 
     result.extend(ordered)
 
@@ -97,10 +196,20 @@ def _ordered_fields(series: Iterable[dict]) -> list[str]:
         result.append(watch_ucnt)
     if pcu_total:
         result.append(pcu_total)
+    result.append("keyEvent")  # always keep the key event column last
 
     return result
 
 
+def _data_rows(series: Iterable[dict], fields: Sequence[str]) -> Iterator[tuple[object, ...]]:
+    """Lazily project every entry onto ``fields``, filling missing ones with ``""``."""
+    defaults = dict.fromkeys(fields, "")
+    getter = itemgetter(*fields)
+    if len(fields) == 1:  # itemgetter returns a bare value for a single key
+        return ((getter({**defaults, **entry}),) for entry in series)
+    return (getter({**defaults, **entry}) for entry in series)
+
+
 def _column_name(index: int) -> str:
     """Convert a 1-based column index into Excel-style column letters."""
     name = ""
@@ -110,51 +219,130 @@ def _column_name(index: int) -> str:
     return name
 
 
+def _column_names(width: int) -> list[str]:
+    """Column letters for the first ``width`` columns, computed once per sheet."""
+    return [_column_name(index) for index in range(1, width + 1)]
+
+
 def _escape_cell_value(value: object) -> str:
-    text = str(value)
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = escape(text)
-    return text.replace("\n", "&#10;")
-
-
-def _sheet_xml(rows: Sequence[Sequence[object]]) -> str:
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">',
-        "  <sheetData>",
-    ]
-    for row_index, row in enumerate(rows, start=1):
-        lines.append(f'    <row r="{row_index}">')
-        for column_index, value in enumerate(row, start=1):
-            if value in ("", None):
+    # Each replace is one C-level scan that is a no-op for clean text; this
+    # measured faster than both saxutils.escape and a str.translate table.
+    return (
+        str(value)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\r\n", "&#10;")
+        .replace("\r", "&#10;")
+        .replace("\n", "&#10;")
+    )
+
+
+_SHEET_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\n'
+    b"<sheetData>\n"
+)
+_SHEET_FOOTER = b"</sheetData>\n</worksheet>\n"
+_ROW_START = b'<row r="%d">'
+_ROW_END = b"</row>\n"
+_SHARED_STR_CELL = b'<c r="%s%d" t="s"><v>%d</v></c>'
+_SHARED_STR_ITEM = b'<si><t xml:space="preserve">%s</t></si>'
+_NUMBER_CELL = b'<c r="%s%d"><v>%s</v></c>'
+_BOOL_CELL = b'<c r="%s%d" t="b"><v>%d</v></c>'
+# Excel's General format shows integers of up to 11 digits as-is; longer
+# integers and digit strings (e.g. operatorID) stay text so they are not
+# rounded or rendered in scientific notation.
+_MAX_NUMERIC_DIGITS = 11
+_MAX_NUMERIC_INT = 10**_MAX_NUMERIC_DIGITS
+
+
+def _is_plain_integer(text: str) -> bool:
+    """Whether ``text`` is a non-negative decimal integer safe to store as a number."""
+    return (
+        text.isascii()
+        and text.isdigit()
+        and len(text) <= _MAX_NUMERIC_DIGITS
+        and (text[0] != "0" or text == "0")
+    )
+
+
+def _encode_row(
+    row_index: int,
+    row: Sequence[object],
+    column_names: Sequence[bytes],
+    shared_strings: dict[str, int],
+) -> bytes:
+    parts = [_ROW_START % row_index]
+    for column_name, value in zip(column_names, row):
+        if value in ("", None):
+            continue
+        if isinstance(value, str):
+            if _is_plain_integer(value):
+                parts.append(_NUMBER_CELL % (column_name, row_index, value.encode("ascii")))
                 continue
-            cell_ref = f"{_column_name(column_index)}{row_index}"
-            text = _escape_cell_value(value)
-            lines.append(
-                f'      <c r="{cell_ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
-            )
-        lines.append("    </row>")
-    lines.append("  </sheetData>")
-    lines.append("</worksheet>")
-    return "\n".join(lines)
+        elif isinstance(value, bool):
+            parts.append(_BOOL_CELL % (column_name, row_index, value))
+            continue
+        elif isinstance(value, int):
+            if -_MAX_NUMERIC_INT < value < _MAX_NUMERIC_INT:
+                parts.append(_NUMBER_CELL % (column_name, row_index, b"%d" % value))
+                continue
+        elif isinstance(value, float) and math.isfinite(value):
+            parts.append(_NUMBER_CELL % (column_name, row_index, repr(value).encode("ascii")))
+            continue
+        text = value if isinstance(value, str) else str(value)
+        index = shared_strings.get(text)
+        if index is None:
+            index = shared_strings[text] = len(shared_strings)
+        parts.append(_SHARED_STR_CELL % (column_name, row_index, index))
+    parts.append(_ROW_END)
+    return b"".join(parts)
+
+
+def _write_sheet(
+    rows: Iterable[Sequence[object]], width: int, fh: BinaryIO, shared_strings: dict[str, int]
+) -> None:
+    """Stream the worksheet XML into ``fh`` one row at a time.
+
+    Text cells reference ``shared_strings``, which is filled in as new
+    strings are encountered and must be written out afterwards.
+    """
+    encode_row = _encode_row if _sheet_c is None else _sheet_c.encode_row
+    column_names = [name.encode("ascii") for name in _column_names(width)]
+    fh.write(_SHEET_HEADER)
+    for row_index, row in enumerate(rows, start=1):
+        fh.write(encode_row(row_index, row, column_names, shared_strings))
+    fh.write(_SHEET_FOOTER)
+
 
+def _write_shared_strings(shared_strings: dict[str, int], fh: BinaryIO) -> None:
+    # Dicts keep insertion order, which matches the assigned indices.
+    fh.write(
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+        b' uniqueCount="%d">\n' % len(shared_strings)
+    )
+    for text in shared_strings:
+        fh.write(_SHARED_STR_ITEM % _escape_cell_value(text).encode("utf-8"))
+    fh.write(b"\n</sst>\n")
 
-def _content_types_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8"?>
+
+_CONTENT_TYPES_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
   <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
   <Default Extension="xml" ContentType="application/xml"/>
   <Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
   <Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
   <Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+  <Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
   <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
   <Override PartName="/docProps/app.xml" ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>
 </Types>
 """
 
 
-def _root_rels_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8"?>
+_ROOT_RELS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
   <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
@@ -163,8 +351,7 @@ def _root_rels_xml() -> str:
 """
 
 
-def _workbook_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_WORKBOOK_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
   <sheets>
     <sheet name="data" sheetId="1" r:id="rId1"/>
@@ -173,17 +360,16 @@ def _workbook_xml() -> str:
 """
 
 
-def _workbook_rels_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8"?>
+_WORKBOOK_RELS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
   <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+  <Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>
 </Relationships>
 """
 
 
-def _styles_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_STYLES_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
   <fonts count="1">
     <font>
@@ -223,15 +409,14 @@ def _styles_xml() -> str:
 """
 
 
-def _app_props_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_APP_PROPS_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties" xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">
   <Application>json_to_xlsx</Application>
 </Properties>
 """
 
 
-def _core_props_xml() -> str:
+def _core_props_xml() -> bytes:
     timestamp = datetime.now(timezone.utc).replace(microsecond=False).isoformat()
     return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" xmlns:dcmitype="http://purl.org/dc/dcmitype/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
@@ -240,22 +425,169 @@ def _core_props_xml() -> str:
   <dcterms:created xsi:type="dcterms:W3CDTF">{timestamp}</dcterms:created>
   <dcterms:modified xsi:type="dcterms:W3CDTF">{timestamp}</dcterms:modified>
 </cp:coreProperties>
-"""
-
-
-def _write_xlsx(rows: list[list[object]], xlsx_path: Path) -> None:
-    sheet_xml = _sheet_xml(rows)
+""".encode("utf-8")
+
+
+# Private ZipFile attributes _write_deflated_entry relies on, as found in
+# CPython 3.11's zipfile; without any of them the streaming path is used.
+_ZIPFILE_WRITE_INTERNALS = ("_writing", "_lock", "_writecheck", "_didModify", "start_dir", "fp")
+
+
+def _write_deflated_entry(
+    archive: ZipFile, name: str, data: bytes | memoryview, compresslevel: int
+) -> None:
+    """Add ``name`` to ``archive``, compressing ``data`` with libdeflate.
+
+    ZipFile has no public hook for pre-compressed data, so this mirrors what
+    ``ZipFile.writestr`` and ``ZipFile.open(name, "w")`` do once the final
+    sizes are known, including the same write checks and lock. Callers must
+    check ``_ZIPFILE_WRITE_INTERNALS`` first.
+    """
+    zinfo = ZipInfo(name, date_time=time.localtime()[:6])
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = len(data)
+    zinfo.CRC = deflate.crc32(data)
+    compressed = deflate.deflate_compress(data, compresslevel)
+    zinfo.compress_size = len(compressed)
+
+    if archive._writing:
+        raise ValueError("Can't write to ZIP archive while an open writing handle exists.")
+    with archive._lock:
+        archive.fp.seek(archive.start_dir)
+        zinfo.header_offset = archive.start_dir
+        archive._writecheck(zinfo)
+        archive._didModify = True
+        archive.fp.write(zinfo.FileHeader())
+        archive.fp.write(compressed)
+        archive.start_dir = archive.fp.tell()
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[name] = zinfo
+
+
+class _ParallelDeflater:
+    """Drop-in for a raw ``zlib`` compressor that deflates chunks on a thread pool.
+
+    Every chunk gets its own compressor and ends on a ``Z_SYNC_FLUSH`` byte
+    boundary, so the compressed pieces concatenate into one valid DEFLATE
+    stream. zlib releases the GIL while compressing, which lets the chunks
+    run in parallel with each other and with the row encoder.
+    """
+
+    def __init__(self, executor: Executor, compresslevel: int, max_pending: int) -> None:
+        self._executor = executor
+        self._compresslevel = compresslevel
+        self._max_pending = max_pending
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+
+    def _deflate_chunk(self, chunk: bytes, final: bool) -> bytes:
+        compressor = zlib.compressobj(self._compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return compressor.compress(chunk) + compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        self._buffer += data
+        while len(self._buffer) >= _PARALLEL_CHUNK_SIZE:
+            chunk = bytes(self._buffer[:_PARALLEL_CHUNK_SIZE])
+            del self._buffer[:_PARALLEL_CHUNK_SIZE]
+            self._pending.append(self._executor.submit(self._deflate_chunk, chunk, False))
+
+        # Hand back whatever is finished, in order, and block only when too
+        # many chunks are in flight so memory stays bounded.
+        done = []
+        while self._pending and (
+            self._pending[0].done() or len(self._pending) > self._max_pending
+        ):
+            done.append(self._pending.popleft().result())
+        return b"".join(done)
+
+    def flush(self) -> bytes:
+        self._pending.append(
+            self._executor.submit(self._deflate_chunk, bytes(self._buffer), True)
+        )
+        self._buffer.clear()
+        done = [future.result() for future in self._pending]
+        self._pending.clear()
+        return b"".join(done)
+
+
+def _write_streamed_entry(
+    archive: ZipFile,
+    name: str,
+    write: Callable[[BinaryIO], None],
+    compresslevel: int,
+    executor: Executor | None = None,
+    jobs: int = 1,
+) -> None:
+    """Add a deflated ``name`` to ``archive`` whose content is produced by ``write``."""
+    if executor is not None:
+        with archive.open(name, "w", force_zip64=True) as fh:
+            # ZipFile keeps doing the CRC and header bookkeeping; only the
+            # compression step is swapped out. ``_compressor`` is a private
+            # attribute of CPython's _ZipWriteFile (checked against 3.11), so
+            # fall back to its own zlib compressor if it is ever missing.
+            if getattr(fh, "_compressor", None) is not None:
+                fh._compressor = _ParallelDeflater(
+                    executor, compresslevel, max_pending=2 * jobs
+                )
+            write(fh)
+    elif deflate is None or not all(
+        hasattr(archive, attr) for attr in _ZIPFILE_WRITE_INTERNALS
+    ):
+        with archive.open(name, "w", force_zip64=True) as fh:
+            write(fh)
+    else:
+        # libdeflate only compresses whole buffers, so the part is rendered
+        # in memory first.
+        buffer = io.BytesIO()
+        write(buffer)
+        _write_deflated_entry(archive, name, buffer.getbuffer(), compresslevel)
+
+
+def _write_xlsx(
+    rows: Iterable[Sequence[object]],
+    width: int,
+    xlsx_path: Path,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    jobs: int = 1,
+) -> None:
     xlsx_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with ZipFile(xlsx_path, "w", ZIP_DEFLATED) as archive:
-        archive.writestr("[Content_Types].xml", _content_types_xml())
-        archive.writestr("_rels/.rels", _root_rels_xml())
-        archive.writestr("docProps/core.xml", _core_props_xml())
-        archive.writestr("docProps/app.xml", _app_props_xml())
-        archive.writestr("xl/workbook.xml", _workbook_xml())
-        archive.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml())
-        archive.writestr("xl/styles.xml", _styles_xml())
-        archive.writestr("xl/worksheets/sheet1.xml", sheet_xml)
+    # Only the worksheet and shared strings are large enough to be worth
+    # deflating; the fixed package parts are a few hundred bytes each and
+    # are stored as-is.
+    executor = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        with ZipFile(xlsx_path, "w", ZIP_DEFLATED, compresslevel=compresslevel) as archive:
+            archive.writestr("[Content_Types].xml", _CONTENT_TYPES_XML, ZIP_STORED)
+            archive.writestr("_rels/.rels", _ROOT_RELS_XML, ZIP_STORED)
+            archive.writestr("docProps/core.xml", _core_props_xml(), ZIP_STORED)
+            archive.writestr("docProps/app.xml", _APP_PROPS_XML, ZIP_STORED)
+            archive.writestr("xl/workbook.xml", _WORKBOOK_XML, ZIP_STORED)
+            archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML, ZIP_STORED)
+            archive.writestr("xl/styles.xml", _STYLES_XML, ZIP_STORED)
+            shared_strings: dict[str, int] = {}
+            _write_streamed_entry(
+                archive,
+                "xl/worksheets/sheet1.xml",
+                lambda fh: _write_sheet(rows, width, fh, shared_strings),
+                compresslevel,
+                executor,
+                jobs,
+            )
+            _write_streamed_entry(
+                archive,
+                "xl/sharedStrings.xml",
+                lambda fh: _write_shared_strings(shared_strings, fh),
+                compresslevel,
+                executor,
+                jobs,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def _parse_args() -> argparse.Namespace:
@@ -278,27 +610,47 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Optional XLSX file name. Defaults to <json stem>.xlsx",
     )
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESSLEVEL,
+        metavar="{0..9}",
+        help=f"DEFLATE level for the worksheet. Defaults to {DEFAULT_COMPRESSLEVEL}.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Threads used to compress the worksheet. Defaults to 1. Values above 1"
+            " deflate chunks with zlib on a thread pool, so the optional `deflate`"
+            " (libdeflate) package is only used with --jobs 1."
+        ),
+    )
     return parser.parse_args()
 
 
+# Distinguishes an empty ``data.series`` from one whose first entry is null.
+_NO_ENTRY = object()
+
+
 def main() -> None:
     args = _parse_args()
-    series = _load_data_string_series(args.json_path)
+    # The loader's pass collects the columns; the one below streams the rows
+    # straight into the worksheet without materialising them.
+    series, fields = _load_data_string_series(args.json_path)
 
-    if not series:
+    if next(iter(series), _NO_ENTRY) is _NO_ENTRY:
         raise SystemExit("data.series is empty, nothing to write.")
 
-    fields = _ordered_fields(series)
-    if "keyEvent" in fields:
-        fields.remove("keyEvent")
-    fields.append("keyEvent")  # always keep the key event column last
     chinese_labels = [FIELD_LABELS.get(field, field) for field in fields]
-    data_rows = [[entry.get(field, "") for field in fields] for entry in series]
+    rows = chain((fields, chinese_labels), _data_rows(series, fields))
 
     output_name = args.output_name or (args.json_path.stem + ".xlsx")
     xlsx_path = args.output_dir / output_name
 
-    _write_xlsx([fields, chinese_labels, *data_rows], xlsx_path)
+    _write_xlsx(rows, len(fields), xlsx_path, args.compresslevel, max(args.jobs, 1))
     print(f"Wrote {xlsx_path}")
 
 